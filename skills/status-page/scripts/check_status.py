@@ -1,30 +1,41 @@
 #!/usr/bin/env python3
 """Check service status pages for incidents."""
 
+import hashlib
+import io
 import json
+import os
 import re
 import sys
+import threading
 import time
-import urllib.error
-import urllib.request
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
-from functools import lru_cache
+from functools import cached_property, lru_cache
+from itertools import islice
 from pathlib import Path
 
 import tomllib
 
+# urllib, xml.etree, email.utils and concurrent.futures are imported where
+# they are used, so the unknown-service path in main() never loads them
+
 __all__ = [
     "FeedCache",
     "FeedParseError",
     "FeedTooLargeError",
+    "IDENTIFIED",
+    "INVESTIGATING",
     "Incident",
+    "IncidentFeed",
     "MAX_FEED_ENTRIES",
     "MAX_FEED_SIZE_BYTES",
+    "MONITORING",
+    "RESOLVED",
+    "UNKNOWN",
     "extract_status_from_html",
     "fetch_feed",
+    "fetch_feeds",
     "find_service",
     "format_incidents",
     "is_likely_active",
@@ -32,12 +43,13 @@ __all__ = [
     "is_recent_incident",
     "load_services",
     "parse_atom_feed",
+    "parse_feed",
     "parse_rss_feed",
     "parse_timestamp",
 ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Incident:
     """Represents a status page incident."""
 
@@ -45,76 +57,256 @@ class Incident:
     link: str
     status: str
     published: str = ""
+    published_dt: datetime | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Parse once up front so filtering and formatting can reuse it
+        object.__setattr__(self, "published_dt", parse_timestamp(self.published))
+
+
+class IncidentFeed(list):
+    """A list of incidents, as returned by the feed parsers.
+
+    Also indexes incidents by title and by link for direct lookup. When
+    several share a key the first (most recent) one wins. The indexes are
+    built on first use, so don't mutate the list after reading them.
+    """
+
+    @cached_property
+    def by_title(self) -> dict[str, Incident]:
+        index = {}
+        for incident in self:
+            index.setdefault(incident.title, incident)
+        return index
+
+    @cached_property
+    def by_link(self) -> dict[str, Incident]:
+        index = {}
+        for incident in self:
+            index.setdefault(incident.link, incident)
+        return index
 
 
 class FeedCache:
-    """Simple file-based cache for feed content."""
+    """Simple file-based cache for feed content.
+
+    Metadata is stored per key in {key}.json, and content is stored by hash
+    in content/{hash}.xml, so keys whose feeds are identical share one file.
+    Parsed incidents can be stored next to the content they came from, in
+    content/{hash}.{feed_type}.json.
+    """
+
+    # Serializes store() across threads, so one key never discards content
+    # that another key has just started pointing at
+    _store_lock = threading.Lock()
 
     def __init__(self, cache_dir: Path):
         self.cache_dir = cache_dir
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-
-    def _content_path(self, key: str) -> Path:
-        return self.cache_dir / f"{key}.xml"
+        self.content_dir = cache_dir / "content"
+        self.content_dir.mkdir(parents=True, exist_ok=True)
 
-    def _meta_path(self, key: str) -> Path:
+    def _path(self, key: str) -> Path:
         return self.cache_dir / f"{key}.json"
 
+    def _content_path(self, content_hash: str) -> Path:
+        return self.content_dir / f"{content_hash}.xml"
+
+    def _parsed_path(self, content_hash: str, feed_type: str) -> Path:
+        return self.content_dir / f"{content_hash}.{feed_type}.json"
+
+    def _read_meta(self, key: str) -> dict | None:
+        try:
+            return json.loads(self._path(key).read_bytes().decode("utf-8"))
+        except FileNotFoundError:
+            return None
+
     def get(self, key: str) -> dict | None:
         """Get cached content and metadata for a service key."""
-        content_path = self._content_path(key)
-        meta_path = self._meta_path(key)
+        meta = self._read_meta(key)
 
-        if not content_path.exists() or not meta_path.exists():
+        # Entries written before content was stored by hash have no hash
+        if not meta or "content_hash" not in meta:
             return None
 
-        content = content_path.read_text()
-        meta = json.loads(meta_path.read_text())
+        try:
+            content_bytes = self._content_path(meta["content_hash"]).read_bytes()
+        except FileNotFoundError:
+            return None
 
         return {
-            "content": content,
+            "content": content_bytes,
+            "content_hash": meta["content_hash"],
             "etag": meta.get("etag"),
+            "last_modified": meta.get("last_modified"),
             "fetched_at": meta.get("fetched_at"),
         }
 
     def get_if_fresh(self, key: str, max_age_seconds: int) -> dict | None:
         """Get cached content only if it's still fresh. Returns None if stale or missing."""
-        cached = self.get(key)
-        if not cached:
+        if not self.is_fresh(key, max_age_seconds):
             return None
 
-        fetched_at = cached.get("fetched_at", 0)
-        if (time.time() - fetched_at) >= max_age_seconds:
+        return self.get(key)
+
+    def store(
+        self,
+        key: str,
+        content: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ):
+        """Store content and metadata for a service key.
+
+        Files are written to a temporary path and moved into place, so
+        readers never see a partially written entry.
+        """
+        content_hash = _hash_content(content)
+
+        with self._store_lock:
+            content_path = self._content_path(content_hash)
+            if not content_path.exists():
+                _write_atomic(content_path, content)
+
+            previous = self._read_meta(key)
+            now = time.time()
+
+            path = self._path(key)
+            _write_atomic(
+                path,
+                json.dumps(
+                    {
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "fetched_at": now,
+                        "content_hash": content_hash,
+                    },
+                    separators=(",", ":"),
+                ).encode("utf-8"),
+                # Pin the mtime to fetched_at so freshness checks can rely on it
+                mtime=now,
+            )
+
+            previous_hash = previous.get("content_hash") if previous else None
+            if previous_hash and previous_hash != content_hash:
+                self._discard_content(previous_hash)
+
+            # Content stored per key before it was stored by hash
+            (self.cache_dir / f"{key}.xml").unlink(missing_ok=True)
+
+    def _discard_content(self, content_hash: str):
+        """Delete a content file unless another key still refers to it."""
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                meta = json.loads(meta_path.read_bytes().decode("utf-8"))
+            except (OSError, ValueError):
+                continue
+            if meta.get("content_hash") == content_hash:
+                return
+
+        self._content_path(content_hash).unlink(missing_ok=True)
+        for parsed_path in self.content_dir.glob(f"{content_hash}.*.json"):
+            parsed_path.unlink(missing_ok=True)
+
+    def get_parsed(self, content_hash: str, feed_type: str) -> IncidentFeed | None:
+        """Get incidents previously parsed from the content with this hash.
+
+        A missing or unreadable file is a miss, since the content can always
+        be parsed again.
+        """
+        try:
+            parsed = json.loads(
+                self._parsed_path(content_hash, feed_type).read_bytes().decode("utf-8")
+            )
+        except (OSError, ValueError):
             return None
 
-        return cached
+        if not isinstance(parsed, dict) or parsed.get("version") != _PARSED_FORMAT_VERSION:
+            return None
 
-    def store(self, key: str, content: str, etag: str | None = None):
-        """Store content and metadata for a service key."""
-        content_path = self._content_path(key)
-        meta_path = self._meta_path(key)
+        try:
+            return IncidentFeed(
+                Incident(
+                    title=title, link=link, status=sys.intern(status), published=published
+                )
+                for title, link, status, published in parsed["incidents"]
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
 
-        content_path.write_text(content)
-        meta_path.write_text(
+    def store_parsed(self, content_hash: str, feed_type: str, incidents: list[Incident]):
+        """Store incidents parsed from the content with this hash."""
+        _write_atomic(
+            self._parsed_path(content_hash, feed_type),
             json.dumps(
                 {
-                    "etag": etag,
-                    "fetched_at": time.time(),
-                }
-            )
+                    "version": _PARSED_FORMAT_VERSION,
+                    "incidents": [
+                        [i.title, i.link, i.status, i.published] for i in incidents
+                    ],
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8"),
         )
 
     def is_fresh(self, key: str, max_age_seconds: int) -> bool:
-        """Check if cached content is still fresh."""
-        meta_path = self._meta_path(key)
-
-        if not meta_path.exists():
+        """Check if cached content is still fresh.
+
+        Uses the metadata file's mtime, which is set when the entry is
+        stored, so no file content needs to be read.
+        """
+        try:
+            mtime = os.stat(self._path(key)).st_mtime
+        except FileNotFoundError:
             return False
 
-        meta = json.loads(meta_path.read_text())
-        fetched_at = meta.get("fetched_at", 0)
+        return (time.time() - mtime) < max_age_seconds
+
+
+# Bump when parsing changes, so incidents parsed by older code are ignored
+_PARSED_FORMAT_VERSION = 2
+
+
+def _hash_content(content: bytes) -> str:
+    """Fingerprint feed content for use as a cache filename."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes, mtime: float | None = None):
+    """Write data to a temporary file next to path, then move it into place."""
+    # Unique per writer, since concurrent fetches may store the same content
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    if mtime is not None:
+        os.utime(tmp_path, (mtime, mtime))
+    os.replace(tmp_path, path)
 
-        return (time.time() - fetched_at) < max_age_seconds
+
+_STATUS_RE = re.compile(r"<strong>(\w+)</strong>")
+
+# Statuses are interned, so every Incident with the same status shares one
+# string and these constants can be compared with `is`
+INVESTIGATING = sys.intern("Investigating")
+IDENTIFIED = sys.intern("Identified")
+MONITORING = sys.intern("Monitoring")
+RESOLVED = sys.intern("Resolved")
+UNKNOWN = sys.intern("Unknown")
+
+# Canonical spelling of the update statuses status pages use, by lowercase
+_STATUS_NAMES = {
+    status.lower(): status
+    for status in (
+        INVESTIGATING,
+        IDENTIFIED,
+        MONITORING,
+        sys.intern("Update"),
+        RESOLVED,
+        sys.intern("Postmortem"),
+        sys.intern("Scheduled"),
+        sys.intern("Verifying"),
+        sys.intern("Completed"),
+    )
+}
 
 
 def extract_status_from_html(html_content: str) -> str:
@@ -126,11 +318,15 @@ def extract_status_from_html(html_content: str) -> str:
     Note: The raw feed contains HTML entities like &lt;strong&gt;, but
     xml.etree.ElementTree automatically unescapes these when parsing,
     so we match against literal <strong> tags here.
+
+    Known statuses are normalized to their usual capitalization; anything
+    else is returned as written. Either way the result is interned.
     """
-    match = re.search(r"<strong>(\w+)</strong>", html_content)
+    match = _STATUS_RE.search(html_content)
     if match:
-        return match.group(1)
-    return "Unknown"
+        status = match.group(1)
+        return _STATUS_NAMES.get(status.lower()) or sys.intern(status)
+    return UNKNOWN
 
 
 class FeedParseError(Exception):
@@ -143,88 +339,177 @@ class FeedParseError(Exception):
 MAX_FEED_ENTRIES = 100
 
 
-def parse_atom_feed(
-    content: str, max_entries: int = MAX_FEED_ENTRIES
-) -> list[Incident]:
-    """Parse an Atom feed and return a list of incidents.
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+
+@dataclass(frozen=True)
+class _FeedFormat:
+    """The element tags that make up an incident in one feed format."""
+
+    entry: str
+    title: str
+    link: str
+    published: str
+    html: str
+    # Atom puts the URL in the href of the rel="alternate" link; RSS uses text
+    link_in_href: bool
+    # Atom entries are children of the root; RSS items sit inside <channel>
+    entries_at_root: bool
+
+
+_ATOM = _FeedFormat(
+    entry=f"{_ATOM_NS}entry",
+    title=f"{_ATOM_NS}title",
+    link=f"{_ATOM_NS}link",
+    published=f"{_ATOM_NS}published",
+    html=f"{_ATOM_NS}content",
+    link_in_href=True,
+    entries_at_root=True,
+)
+
+# RSS 2.0 elements are not namespaced
+_RSS = _FeedFormat(
+    entry="item",
+    title="title",
+    link="link",
+    published="pubDate",
+    html="description",
+    link_in_href=False,
+    entries_at_root=False,
+)
+
+# Feed formats by the tag of the document's root element
+_FEED_FORMATS = {f"{_ATOM_NS}feed": _ATOM, "rss": _RSS}
+
+
+def _iter_incidents(content: bytes | str, feed_format: _FeedFormat | None = None):
+    """Yield an Incident for each entry of a feed as it is parsed.
+
+    Entries are streamed with iterparse and detached from their parent once
+    converted, so memory stays bounded by a single entry rather than the
+    whole document. Bytes are handed to the parser as-is, which decodes them
+    according to the XML declaration; strings are already decoded, so any
+    declared encoding is ignored. Without a feed_format, the format is
+    picked from the root element.
 
     Raises:
-        FeedParseError: If the content is not valid XML or not a valid Atom feed.
+        FeedParseError: If the content is not valid XML, or the format is
+            not given and the root element is not a known feed type.
     """
+    import xml.etree.ElementTree as ET
+
+    if isinstance(content, str):
+        source = io.StringIO(content)
+    else:
+        source = io.BytesIO(content)
+
+    parents = []
     try:
-        root = ET.fromstring(content)
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                if feed_format is None:
+                    feed_format = _FEED_FORMATS.get(elem.tag)
+                    if feed_format is None:
+                        raise FeedParseError(f"Unrecognized feed root <{elem.tag}>")
+                parents.append(elem)
+                continue
+
+            parents.pop()
+            if elem.tag == feed_format.entry and (
+                len(parents) == 1 or not feed_format.entries_at_root
+            ):
+                yield _incident_from_entry(elem, feed_format)
+                if parents:
+                    parents[-1].remove(elem)
     except ET.ParseError as e:
         raise FeedParseError(f"Invalid XML: {e}") from e
 
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-    incidents = []
-    for entry in root.findall("atom:entry", ns):
-        if len(incidents) >= max_entries:
-            break
-
-        title = entry.find("atom:title", ns)
-        link = entry.find("atom:link[@rel='alternate']", ns)
-        published = entry.find("atom:published", ns)
-        content_elem = entry.find("atom:content", ns)
-
-        incident = Incident(
-            title=(title.text or "") if title is not None else "",
-            link=(link.get("href") or "") if link is not None else "",
-            published=(published.text or "") if published is not None else "",
-            status=extract_status_from_html(content_elem.text or "")
-            if content_elem is not None
-            else "Unknown",
-        )
-        incidents.append(incident)
 
-    return incidents
+def _incident_from_entry(entry, feed_format: _FeedFormat) -> Incident:
+    """Build an Incident from an Atom entry or RSS item element."""
+    # Collect every field in one pass over the entry's children, keeping
+    # the first match for each like Element.find would
+    title = link = published = html = None
+    for child in entry:
+        tag = child.tag
+        if tag == feed_format.title:
+            if title is None:
+                title = child.text or ""
+        elif tag == feed_format.link:
+            if link is None:
+                if not feed_format.link_in_href:
+                    link = child.text or ""
+                elif child.get("rel") == "alternate":
+                    link = child.get("href") or ""
+        elif tag == feed_format.published:
+            if published is None:
+                published = child.text or ""
+        elif tag == feed_format.html:
+            if html is None:
+                html = child.text or ""
+
+    return Incident(
+        title=title or "",
+        link=link or "",
+        published=published or "",
+        status=extract_status_from_html(html) if html is not None else UNKNOWN,
+    )
+
+
+def parse_feed(
+    content: bytes | str, max_entries: int = MAX_FEED_ENTRIES
+) -> IncidentFeed:
+    """Parse an Atom or RSS feed, detected from its root element.
+
+    Raises:
+        FeedParseError: If the content is not valid XML or not an Atom or RSS feed.
+    """
+    return IncidentFeed(islice(_iter_incidents(content), max(max_entries, 0)))
+
 
+def parse_atom_feed(
+    content: bytes | str, max_entries: int = MAX_FEED_ENTRIES
+) -> IncidentFeed:
+    """Parse an Atom feed and return a list of incidents.
+
+    Raises:
+        FeedParseError: If the content is not valid XML or not a valid Atom feed.
+    """
+    return IncidentFeed(islice(_iter_incidents(content, _ATOM), max(max_entries, 0)))
 
-def parse_rss_feed(content: str, max_entries: int = MAX_FEED_ENTRIES) -> list[Incident]:
+
+def parse_rss_feed(
+    content: bytes | str, max_entries: int = MAX_FEED_ENTRIES
+) -> IncidentFeed:
     """Parse an RSS feed and return a list of incidents.
 
     Raises:
         FeedParseError: If the content is not valid XML or not a valid RSS feed.
     """
-    try:
-        root = ET.fromstring(content)
-    except ET.ParseError as e:
-        raise FeedParseError(f"Invalid XML: {e}") from e
+    return IncidentFeed(islice(_iter_incidents(content, _RSS), max(max_entries, 0)))
 
-    incidents = []
-    for item in root.findall(".//item"):
-        if len(incidents) >= max_entries:
-            break
-
-        title = item.find("title")
-        link = item.find("link")
-        description = item.find("description")
-        pub_date = item.find("pubDate")
-
-        incident = Incident(
-            title=(title.text or "") if title is not None else "",
-            link=(link.text or "") if link is not None else "",
-            published=(pub_date.text or "") if pub_date is not None else "",
-            status=extract_status_from_html(description.text or "")
-            if description is not None
-            else "Unknown",
-        )
-        incidents.append(incident)
 
-    return incidents
+# Parsed service configs keyed by path, tagged with (st_mtime_ns, st_size)
+_SERVICES_CACHE: dict[str, tuple[int, int, dict]] = {}
+
 
+def load_services(path: Path) -> dict:
+    """Load service configuration from a TOML file.
+
+    Results are cached and invalidated when the file's mtime or size changes.
+    """
+    st = os.stat(path)
+    key = str(path)
 
-@lru_cache(maxsize=8)
-def _load_services_cached(path_str: str) -> dict:
-    """Internal cached loader using string path for hashability."""
-    with open(path_str, "rb") as f:
-        return tomllib.load(f)
+    cached = _SERVICES_CACHE.get(key)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
 
+    with open(path, "rb") as f:
+        services = tomllib.load(f)
 
-def load_services(path: Path) -> dict:
-    """Load service configuration from a TOML file. Results are cached."""
-    return _load_services_cached(str(path))
+    _SERVICES_CACHE[key] = (st.st_mtime_ns, st.st_size, services)
+    return services
 
 
 def find_service(services: dict, query: str) -> tuple[str, dict] | None:
@@ -253,91 +538,204 @@ class FeedTooLargeError(Exception):
 MAX_FEED_SIZE_BYTES = 1024 * 1024
 
 
+# Read size for bodies without a usable Content-Length
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def _read_limited(response, max_size_bytes: int) -> bytes:
+    """Read a response body, enforcing max_size_bytes.
+
+    Raises:
+        FeedTooLargeError: If the body exceeds max_size_bytes.
+    """
+    # Check Content-Length header first (if provided)
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > max_size_bytes:
+            raise FeedTooLargeError(
+                f"Feed size {content_length} exceeds limit of {max_size_bytes} bytes"
+            )
+        # http.client stops at Content-Length, so one read gets the body
+        return response.read(int(content_length))
+
+    # Otherwise read in chunks so small feeds don't allocate the full limit
+    content = bytearray()
+    while chunk := response.read(_READ_CHUNK_SIZE):
+        content += chunk
+        if len(content) > max_size_bytes:
+            raise FeedTooLargeError(f"Feed exceeds limit of {max_size_bytes} bytes")
+
+    return bytes(content)
+
+
 def fetch_feed(
     url: str,
     cache: FeedCache | None = None,
     cache_key: str | None = None,
     max_age_seconds: int = 60,
     max_size_bytes: int = MAX_FEED_SIZE_BYTES,
-) -> str:
-    """Fetch feed content from a URL, using cache if available.
+    stale_while_revalidate: bool = False,
+) -> bytes:
+    """Fetch raw feed content from a URL, using cache if available.
+
+    With stale_while_revalidate, stale cached content is returned immediately
+    and refreshed on a background thread. The thread is not a daemon, so a
+    short-lived process still finishes the refresh before exiting. Nothing
+    is served until the feed has been fetched once.
 
     Raises:
         FeedTooLargeError: If the response exceeds max_size_bytes.
     """
     key = cache_key or url
 
+    # One lookup serves both the freshness check and the conditional headers
+    cached = cache.get(key) if cache else None
+
     # Check if we have fresh cached content
-    if cache:
-        fresh = cache.get_if_fresh(key, max_age_seconds)
-        if fresh:
-            return fresh["content"]
+    if cached and (time.time() - (cached["fetched_at"] or 0)) < max_age_seconds:
+        return cached["content"]
+
+    if stale_while_revalidate and cached:
+        threading.Thread(
+            target=_revalidate_feed,
+            args=(url, cache, key, cached, max_size_bytes),
+        ).start()
+        return cached["content"]
+
+    return _download_feed(url, cache, key, cached, max_size_bytes)
+
+
+def _revalidate_feed(
+    url: str, cache: FeedCache, key: str, cached: dict, max_size_bytes: int
+):
+    """Refresh a cache entry in the background, ignoring failures.
+
+    The stale entry stays in place on error, so the next call retries.
+    """
+    import http.client
+
+    try:
+        _download_feed(url, cache, key, cached, max_size_bytes)
+    except (OSError, ValueError, FeedTooLargeError, http.client.HTTPException):
+        pass
+
+
+def _download_feed(
+    url: str,
+    cache: FeedCache | None,
+    key: str,
+    cached: dict | None,
+    max_size_bytes: int,
+) -> bytes:
+    """Download a feed, revalidating against the cached entry if there is one."""
+    import urllib.error
+    import urllib.request
 
     # Build request headers
     headers = {"User-Agent": "status-page-checker/1.0"}
 
-    # Add If-None-Match header if we have a cached ETag
+    # Add conditional request headers from the cached ETag / Last-Modified
     cached_etag = None
-    if cache:
-        cached = cache.get(key)
-        if cached and cached.get("etag"):
-            cached_etag = cached["etag"]
-            headers["If-None-Match"] = cached_etag
+    cached_last_modified = None
+    if cached and cached.get("etag"):
+        cached_etag = cached["etag"]
+        headers["If-None-Match"] = cached_etag
+    if cached and cached.get("last_modified"):
+        cached_last_modified = cached["last_modified"]
+        headers["If-Modified-Since"] = cached_last_modified
 
     req = urllib.request.Request(url, headers=headers)
 
     try:
         with urllib.request.urlopen(req, timeout=10) as response:
-            # Check Content-Length header first (if provided)
-            content_length = response.headers.get("Content-Length")
-            if content_length and int(content_length) > max_size_bytes:
-                raise FeedTooLargeError(
-                    f"Feed size {content_length} exceeds limit of {max_size_bytes} bytes"
-                )
-
-            # Read with size limit
-            content_bytes = response.read(max_size_bytes + 1)
-            if len(content_bytes) > max_size_bytes:
-                raise FeedTooLargeError(f"Feed exceeds limit of {max_size_bytes} bytes")
-
-            content = content_bytes.decode("utf-8")
+            content = _read_limited(response, max_size_bytes)
             etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
 
             # Store in cache
             if cache:
-                cache.store(key, content, etag=etag)
+                cache.store(key, content, etag=etag, last_modified=last_modified)
 
             return content
 
     except urllib.error.HTTPError as e:
         # 304 Not Modified - use cached content
-        if e.code == 304 and cache:
-            cached = cache.get(key)
-            if cached:
-                # Update the timestamp so it stays fresh
-                cache.store(key, cached["content"], etag=cached_etag)
-                return cached["content"]
+        if e.code == 304 and cache and cached:
+            # Update the timestamp so it stays fresh, picking up any new
+            # validators the server sent with the 304
+            headers = e.headers or {}
+            cache.store(
+                key,
+                cached["content"],
+                etag=headers.get("ETag") or cached_etag,
+                last_modified=headers.get("Last-Modified") or cached_last_modified,
+            )
+            return cached["content"]
         raise
 
 
+def fetch_feeds(
+    feeds: dict[str, str],
+    cache: FeedCache | None = None,
+    max_age_seconds: int = 60,
+    max_size_bytes: int = MAX_FEED_SIZE_BYTES,
+    max_workers: int = 16,
+) -> dict[str, bytes]:
+    """Fetch several feeds concurrently. Returns content keyed like `feeds`.
+
+    `feeds` maps a cache key (usually the service key) to its feed URL.
+    Requests overlap on threads, so total time is bounded by the slowest
+    feed rather than the sum of all of them.
+
+    Raises:
+        urllib.error.URLError, FeedTooLargeError: The first error raised by
+            fetch_feed for any of the feeds.
+    """
+    if not feeds:
+        return {}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fetch(item: tuple[str, str]) -> bytes:
+        key, url = item
+        return fetch_feed(
+            url,
+            cache=cache,
+            cache_key=key,
+            max_age_seconds=max_age_seconds,
+            max_size_bytes=max_size_bytes,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(feeds))) as executor:
+        return dict(zip(feeds, executor.map(fetch, feeds.items())))
+
+
+@lru_cache(maxsize=1024)
 def parse_timestamp(timestamp: str) -> datetime | None:
     """Parse a timestamp from either ISO 8601 (Atom) or RFC 822 (RSS) format.
 
-    Returns None if parsing fails.
+    Returns None if parsing fails. Results are cached, since feeds often
+    repeat the same timestamps and datetimes are immutable.
     """
     if not timestamp:
         return None
 
     # Try ISO 8601 format (Atom feeds): 2026-02-04T17:06:50Z
-    try:
-        # Handle Z suffix
-        if timestamp.endswith("Z"):
-            timestamp = timestamp[:-1] + "+00:00"
-        return datetime.fromisoformat(timestamp)
-    except ValueError:
-        pass
+    # These start with the year, while RFC 822 usually starts with a weekday,
+    # so RSS timestamps skip straight to RFC 822 without a failed ISO parse.
+    if timestamp[0].isdigit():
+        try:
+            # Handle Z suffix
+            iso_timestamp = timestamp
+            if iso_timestamp.endswith("Z"):
+                iso_timestamp = iso_timestamp[:-1] + "+00:00"
+            return datetime.fromisoformat(iso_timestamp)
+        except ValueError:
+            pass
 
     # Try RFC 822 format (RSS feeds): Wed, 04 Feb 2026 17:06:50 +0000
+    from email.utils import parsedate_to_datetime
+
     try:
         return parsedate_to_datetime(timestamp)
     except (ValueError, TypeError):
@@ -346,13 +744,19 @@ def parse_timestamp(timestamp: str) -> datetime | None:
     return None
 
 
-def is_recent_incident(incident: Incident, hours: int = 4) -> bool:
-    """Check if incident was updated within the last N hours."""
-    parsed = parse_timestamp(incident.published)
+def is_recent_incident(
+    incident: Incident, hours: int = 4, *, now: datetime | None = None
+) -> bool:
+    """Check if incident was updated within the last N hours.
+
+    Pass `now` to compare several incidents against the same moment.
+    """
+    parsed = incident.published_dt
     if not parsed:
         return False
 
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     age = now - parsed
     return age.total_seconds() < (hours * 3600)
 
@@ -369,25 +773,32 @@ RESOLVED_PATTERNS = [
     "fully operational",
 ]
 
+_RESOLVED_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in RESOLVED_PATTERNS), re.IGNORECASE
+)
+
 
 def is_likely_resolved(incident: Incident) -> bool:
     """Check if status suggests the incident is resolved.
 
     Uses pattern matching to work across different status page providers.
     """
-    status = incident.status.lower()
-    return any(pattern in status for pattern in RESOLVED_PATTERNS)
+    if incident.status is RESOLVED:
+        return True
+    return _RESOLVED_RE.search(incident.status) is not None
 
 
-def is_likely_active(incident: Incident, recent_hours: int = 4) -> bool:
+def is_likely_active(
+    incident: Incident, recent_hours: int = 4, *, now: datetime | None = None
+) -> bool:
     """Check if an incident is likely currently active.
 
     An incident is considered active if:
     1. It was updated recently (within recent_hours), AND
     2. Its status doesn't suggest it's resolved
     """
-    return is_recent_incident(incident, recent_hours) and not is_likely_resolved(
-        incident
+    return is_recent_incident(incident, recent_hours, now=now) and (
+        not is_likely_resolved(incident)
     )
 
 
@@ -402,15 +813,18 @@ def format_incidents(
         return "\n".join(lines)
 
     # Check for active incidents
-    active = [i for i in incidents if is_likely_active(i)]
+    now = datetime.now(timezone.utc)
+    active = [i for i in incidents if is_likely_active(i, now=now)]
 
     if active:
         lines.append("## ACTIVE INCIDENTS")
         lines.append("")
-        for incident in active:
-            lines.append(f">>> [{incident.status}] {incident.title}")
-            if incident.link:
-                lines.append(f"    {incident.link}")
+        lines.extend(
+            f">>> [{i.status}] {i.title}\n    {i.link}"
+            if i.link
+            else f">>> [{i.status}] {i.title}"
+            for i in active
+        )
         lines.append("")
         lines.append("## Recent History")
         lines.append("")
@@ -419,7 +833,7 @@ def format_incidents(
         # Show when the last incident was
         if incidents:
             last_incident = incidents[0]
-            last_time = parse_timestamp(last_incident.published)
+            last_time = last_incident.published_dt
             if last_time:
                 utc_str = last_time.strftime("%Y-%m-%d %H:%M UTC")
                 local_time = last_time.astimezone()
@@ -429,10 +843,12 @@ def format_incidents(
         lines.append("## Recent History")
         lines.append("")
 
-    for incident in incidents[:limit]:
-        lines.append(f"- [{incident.status}] {incident.title}")
-        if incident.link:
-            lines.append(f"  {incident.link}")
+    lines.extend(
+        f"- [{i.status}] {i.title}\n  {i.link}"
+        if i.link
+        else f"- [{i.status}] {i.title}"
+        for i in incidents[:limit]
+    )
 
     return "\n".join(lines)
 
@@ -445,6 +861,11 @@ def get_default_cache_dir() -> Path:
 DEFAULT_SERVICE = "claude"
 
 
+def _write_output(*lines: str):
+    """Write lines to stdout in a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def main():
     """Main entry point."""
     query = sys.argv[1] if len(sys.argv) >= 2 else DEFAULT_SERVICE
@@ -457,8 +878,10 @@ def main():
     result = find_service(services, query)
 
     if not result:
-        print(f"Unknown service: {query}")
-        print(f"Available services: {', '.join(services.keys())}")
+        _write_output(
+            f"Unknown service: {query}",
+            f"Available services: {', '.join(services.keys())}",
+        )
         sys.exit(1)
 
     service_key, service = result
@@ -470,25 +893,33 @@ def main():
     feed_url = service["feed"]
     feed_type = service.get("feed_type", "atom")
 
+    import urllib.error
+
     try:
         content = fetch_feed(
             feed_url, cache=cache, cache_key=service_key, max_age_seconds=60
         )
     except urllib.error.URLError as e:
-        print(f"Error fetching {service['name']} status: {e}")
+        _write_output(f"Error fetching {service['name']} status: {e}")
         sys.exit(1)
 
-    try:
-        if feed_type == "atom":
-            incidents = parse_atom_feed(content)
-        else:
-            incidents = parse_rss_feed(content)
-    except FeedParseError as e:
-        print(f"Error parsing {service['name']} feed: {e}")
-        sys.exit(1)
+    # Unchanged feeds reuse the incidents parsed last time
+    content_hash = _hash_content(content)
+    incidents = cache.get_parsed(content_hash, feed_type)
+    if incidents is None:
+        try:
+            if feed_type == "atom":
+                incidents = parse_atom_feed(content)
+            else:
+                incidents = parse_rss_feed(content)
+        except FeedParseError as e:
+            _write_output(f"Error parsing {service['name']} feed: {e}")
+            sys.exit(1)
+
+        cache.store_parsed(content_hash, feed_type, incidents)
 
     # Output results
-    print(format_incidents(service["name"], incidents))
+    _write_output(format_incidents(service["name"], incidents))
 
 
 if __name__ == "__main__":
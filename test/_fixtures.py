@@ -0,0 +1,42 @@
+"""Feed fixtures shared across test modules.
+
+Each fixture file is read once at import, and parsed at most once per test
+run. Incidents are frozen, so sharing them between test classes is safe.
+"""
+
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# Add the scripts directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "status-page" / "scripts"))
+
+from check_status import IncidentFeed, parse_atom_feed, parse_rss_feed
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+CLAUDE_ATOM_BYTES = (FIXTURES_DIR / "claude" / "2026-02-04-history.atom").read_bytes()
+CLAUDE_RSS_BYTES = (FIXTURES_DIR / "claude" / "2026-02-04-history.rss").read_bytes()
+GITHUB_ATOM_BYTES = (FIXTURES_DIR / "github" / "2026-02-04-history.atom").read_bytes()
+GITHUB_RSS_BYTES = (FIXTURES_DIR / "github" / "2026-02-04-history.rss").read_bytes()
+
+
+@lru_cache(maxsize=None)
+def claude_atom() -> IncidentFeed:
+    return parse_atom_feed(CLAUDE_ATOM_BYTES)
+
+
+@lru_cache(maxsize=None)
+def claude_rss() -> IncidentFeed:
+    return parse_rss_feed(CLAUDE_RSS_BYTES)
+
+
+@lru_cache(maxsize=None)
+def github_atom() -> IncidentFeed:
+    return parse_atom_feed(GITHUB_ATOM_BYTES)
+
+
+@lru_cache(maxsize=None)
+def github_rss() -> IncidentFeed:
+    return parse_rss_feed(GITHUB_RSS_BYTES)
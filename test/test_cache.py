@@ -2,13 +2,16 @@
 
 import sys
 import tempfile
+import threading
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 # Add the scripts directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "status-page" / "scripts"))
 
-from check_status import FeedCache
+import check_status
+from check_status import FeedCache, Incident
 
 
 class TestFeedCache(unittest.TestCase):
@@ -22,7 +25,7 @@ class TestFeedCache(unittest.TestCase):
 
     def test_stores_and_retrieves_content(self):
         key = "claude"
-        content = "<feed>test content</feed>"
+        content = b"<feed>test content</feed>"
 
         self.cache.store(key, content)
         result = self.cache.get(key)
@@ -31,7 +34,7 @@ class TestFeedCache(unittest.TestCase):
 
     def test_stores_etag(self):
         key = "claude"
-        content = "<feed>test</feed>"
+        content = b"<feed>test</feed>"
         etag = '"abc123"'
 
         self.cache.store(key, content, etag=etag)
@@ -39,9 +42,16 @@ class TestFeedCache(unittest.TestCase):
 
         self.assertEqual(result["etag"], etag)
 
+    def test_stores_non_ascii_content(self):
+        content = "<feed>Dégradation — 障害</feed>".encode("utf-8")
+
+        self.cache.store("claude", content)
+
+        self.assertEqual(self.cache.get("claude")["content"], content)
+
     def test_stores_timestamp(self):
         key = "claude"
-        content = "<feed>test</feed>"
+        content = b"<feed>test</feed>"
 
         self.cache.store(key, content)
         result = self.cache.get(key)
@@ -50,14 +60,14 @@ class TestFeedCache(unittest.TestCase):
 
     def test_is_fresh_within_max_age(self):
         key = "claude"
-        self.cache.store(key, "<feed>test</feed>")
+        self.cache.store(key, b"<feed>test</feed>")
 
         # Should be fresh immediately after storing
         self.assertTrue(self.cache.is_fresh(key, max_age_seconds=60))
 
     def test_is_not_fresh_after_max_age(self):
         key = "claude"
-        self.cache.store(key, "<feed>test</feed>")
+        self.cache.store(key, b"<feed>test</feed>")
 
         # Should not be fresh with 0 second max age
         self.assertFalse(self.cache.is_fresh(key, max_age_seconds=0))
@@ -65,6 +75,129 @@ class TestFeedCache(unittest.TestCase):
     def test_is_not_fresh_when_not_cached(self):
         self.assertFalse(self.cache.is_fresh("missing", max_age_seconds=60))
 
+    def test_get_if_fresh_returns_none_when_stale(self):
+        self.cache.store("claude", b"<feed>test</feed>")
+        self.assertIsNone(self.cache.get_if_fresh("claude", max_age_seconds=0))
+
+    def test_is_fresh_uses_fetched_at_as_mtime(self):
+        self.cache.store("claude", b"<feed>test</feed>")
+        fetched_at = self.cache.get("claude")["fetched_at"]
+        mtime = (Path(self.temp_dir) / "claude.json").stat().st_mtime
+        self.assertAlmostEqual(mtime, fetched_at, places=3)
+
+    def test_shares_content_between_keys(self):
+        self.cache.store("claude", b"<feed>same</feed>")
+        self.cache.store("anthropic", b"<feed>same</feed>")
+
+        content_files = list((Path(self.temp_dir) / "content").iterdir())
+        self.assertEqual(len(content_files), 1)
+        self.assertEqual(
+            self.cache.get("claude")["content_hash"],
+            self.cache.get("anthropic")["content_hash"],
+        )
+
+    def test_discards_replaced_content(self):
+        self.cache.store("claude", b"<feed>old</feed>")
+        self.cache.store("claude", b"<feed>new</feed>")
+
+        content_files = list((Path(self.temp_dir) / "content").iterdir())
+        self.assertEqual(len(content_files), 1)
+        self.assertEqual(self.cache.get("claude")["content"], b"<feed>new</feed>")
+
+    def test_keeps_replaced_content_still_in_use(self):
+        self.cache.store("claude", b"<feed>old</feed>")
+        self.cache.store("anthropic", b"<feed>old</feed>")
+        self.cache.store("claude", b"<feed>new</feed>")
+
+        self.assertEqual(self.cache.get("anthropic")["content"], b"<feed>old</feed>")
+
+    def test_concurrent_store_keeps_content_another_key_moves_to(self):
+        self.cache.store("claude", b"<feed>old</feed>")
+        self.cache.store("anthropic", b"<feed>shared</feed>")
+
+        # While claude moves onto anthropic's content, anthropic moves off it
+        write_atomic = check_status._write_atomic
+        other = threading.Thread(
+            target=self.cache.store, args=("anthropic", b"<feed>new</feed>")
+        )
+
+        def racing_write(path, data, mtime=None):
+            if path.name == "claude.json" and other.ident is None:
+                other.start()
+                other.join(timeout=0.2)
+            write_atomic(path, data, mtime=mtime)
+
+        with patch("check_status._write_atomic", side_effect=racing_write):
+            self.cache.store("claude", b"<feed>shared</feed>")
+            other.join()
+
+        self.assertEqual(self.cache.get("claude")["content"], b"<feed>shared</feed>")
+        self.assertEqual(self.cache.get("anthropic")["content"], b"<feed>new</feed>")
+
+    def _content_hash(self, content: bytes) -> str:
+        self.cache.store("claude", content)
+        return self.cache.get("claude")["content_hash"]
+
+    def test_parsed_cache_miss_returns_none(self):
+        content_hash = self._content_hash(b"<feed>test</feed>")
+        self.assertIsNone(self.cache.get_parsed(content_hash, "atom"))
+
+    def test_stores_and_retrieves_parsed_incidents(self):
+        incidents = [
+            Incident(
+                title="Elevated errors",
+                link="https://example.com/1",
+                status="Resolved",
+                published="2026-02-04T17:06:50Z",
+            ),
+            Incident(title="No link", link="", status="Unknown"),
+        ]
+
+        content_hash = self._content_hash(b"<feed>test</feed>")
+        self.cache.store_parsed(content_hash, "atom", incidents)
+
+        self.assertEqual(self.cache.get_parsed(content_hash, "atom"), incidents)
+        self.assertIsNone(self.cache.get_parsed(content_hash, "rss"))
+
+        other_hash = self._content_hash(b"<feed>other</feed>")
+        self.assertIsNone(self.cache.get_parsed(other_hash, "atom"))
+
+    def test_corrupt_parsed_incidents_are_a_miss(self):
+        content_hash = self._content_hash(b"<feed>test</feed>")
+        parsed_path = Path(self.temp_dir) / "content" / f"{content_hash}.atom.json"
+
+        for data in (
+            b'{"version": 2, "incid',
+            b'{"version": 2, "incidents": [["title", "link"]]}',
+            b'{"version": 2}',
+            b"[]",
+        ):
+            with self.subTest(data=data):
+                parsed_path.write_bytes(data)
+                self.assertIsNone(self.cache.get_parsed(content_hash, "atom"))
+
+    def test_discards_parsed_incidents_with_replaced_content(self):
+        content_hash = self._content_hash(b"<feed>old</feed>")
+        self.cache.store_parsed(content_hash, "atom", [])
+        self.cache.store("claude", b"<feed>new</feed>")
+
+        self.assertIsNone(self.cache.get_parsed(content_hash, "atom"))
+
+    def test_ignores_entry_without_content_hash(self):
+        # Older versions of the cache stored content inline or in {key}.xml
+        (Path(self.temp_dir) / "claude.json").write_text(
+            '{"etag": null, "fetched_at": 0, "content": "<feed>old</feed>"}'
+        )
+        self.assertIsNone(self.cache.get("claude"))
+
+    def test_store_removes_legacy_content_file(self):
+        legacy = Path(self.temp_dir) / "claude.xml"
+        legacy.write_bytes(b"<feed>old</feed>")
+
+        self.cache.store("claude", b"<feed>new</feed>")
+
+        self.assertFalse(legacy.exists())
+
 
 if __name__ == "__main__":
     unittest.main()
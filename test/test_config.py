@@ -1,6 +1,8 @@
 """Tests for loading service configuration."""
 
+import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -27,6 +29,30 @@ class TestLoadServices(unittest.TestCase):
         self.assertEqual(self.services["claude"]["feed"], "https://status.claude.com/history.atom")
 
 
+class TestLoadServicesCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "services.toml"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_returns_cached_result_when_unchanged(self):
+        self.path.write_text('[claude]\nname = "Claude"\n')
+        self.assertIs(load_services(self.path), load_services(self.path))
+
+    def test_reloads_when_file_changes(self):
+        self.path.write_text('[claude]\nname = "Claude"\n')
+        self.assertEqual(load_services(self.path)["claude"]["name"], "Claude")
+
+        self.path.write_text('[claude]\nname = "Anthropic"\n')
+        # Bump mtime explicitly in case the filesystem timestamp is coarse
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(load_services(self.path)["claude"]["name"], "Anthropic")
+
+
 class TestFindService(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -9,7 +9,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "status-page" /
 
 from check_status import (
     FeedParseError,
+    RESOLVED,
     parse_atom_feed,
+    parse_feed,
     parse_rss_feed,
     extract_status_from_html,
 )
@@ -34,6 +36,11 @@ class TestMalformedXml(unittest.TestCase):
         with self.assertRaises(FeedParseError):
             parse_rss_feed("")
 
+    def test_feed_raises_on_unrecognized_root(self):
+        with self.assertRaises(FeedParseError) as ctx:
+            parse_feed('<?xml version="1.0"?><html><body></body></html>')
+        self.assertIn("Unrecognized feed", str(ctx.exception))
+
 
 class TestEmptyFeed(unittest.TestCase):
     def test_atom_feed_returns_empty_list_for_no_entries(self):
@@ -69,6 +76,30 @@ class TestMissingFields(unittest.TestCase):
         self.assertEqual(incidents[0].status, "Unknown")
 
 
+class TestEntryLimit(unittest.TestCase):
+    def test_atom_feed_stops_at_max_entries(self):
+        xml = '<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        xml += "<entry><title>Incident</title></entry>" * 5
+        xml += "</feed>"
+        incidents = parse_atom_feed(xml, max_entries=3)
+        self.assertEqual(len(incidents), 3)
+
+    def test_rss_feed_stops_at_max_entries(self):
+        xml = '<?xml version="1.0"?><rss><channel>'
+        xml += "<item><title>Incident</title></item>" * 5
+        xml += "</channel></rss>"
+        incidents = parse_rss_feed(xml, max_entries=3)
+        self.assertEqual(len(incidents), 3)
+
+    def test_atom_feed_stops_parsing_after_max_entries(self):
+        # Content past the last needed entry is never parsed
+        xml = '<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        xml += "<entry><title>Incident</title></entry>" * 2
+        xml += "<entry><<<<"
+        incidents = parse_atom_feed(xml, max_entries=2)
+        self.assertEqual(len(incidents), 2)
+
+
 class TestExtractStatus(unittest.TestCase):
     def test_returns_unknown_for_empty_content(self):
         self.assertEqual(extract_status_from_html(""), "Unknown")
@@ -80,6 +111,15 @@ class TestExtractStatus(unittest.TestCase):
         html = "<strong>Investigating</strong> then <strong>Resolved</strong>"
         self.assertEqual(extract_status_from_html(html), "Investigating")
 
+    def test_normalizes_known_status_case(self):
+        self.assertEqual(extract_status_from_html("<strong>RESOLVED</strong>"), "Resolved")
+
+    def test_returns_interned_status(self):
+        self.assertIs(extract_status_from_html("<strong>resolved</strong>"), RESOLVED)
+
+    def test_keeps_unknown_status_as_written(self):
+        self.assertEqual(extract_status_from_html("<strong>DEGRADED</strong>"), "DEGRADED")
+
 
 if __name__ == "__main__":
     unittest.main()
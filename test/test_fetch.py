@@ -1,27 +1,30 @@
 """Tests for feed fetching with mocked network."""
 
+import http.client
+import io
 import sys
 import tempfile
+import threading
 import unittest
+import urllib.error
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import patch
 
 # Add the scripts directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "status-page" / "scripts"))
 
-from check_status import FeedCache, fetch_feed
+from check_status import FeedCache, FeedTooLargeError, fetch_feed, fetch_feeds
 
 
 class MockResponse:
     """Mock HTTP response."""
     def __init__(self, content: bytes, headers: dict = None):
-        self.content = content
+        self.body = io.BytesIO(content)
         self.headers = headers or {}
 
     def read(self, size: int = -1):
-        if size < 0:
-            return self.content
-        return self.content[:size]
+        return self.body.read(size)
 
     def __enter__(self):
         return self
@@ -31,20 +34,20 @@ class MockResponse:
 
 
 class TestFetchFeed(unittest.TestCase):
-    @patch("check_status.urllib.request.urlopen")
+    @patch("urllib.request.urlopen")
     def test_fetches_content_from_url(self, mock_urlopen):
         mock_urlopen.return_value = MockResponse(b"<feed>test</feed>")
 
         content = fetch_feed("https://example.com/feed.atom")
 
-        self.assertEqual(content, "<feed>test</feed>")
+        self.assertEqual(content, b"<feed>test</feed>")
         mock_urlopen.assert_called_once()
 
-    @patch("check_status.urllib.request.urlopen")
+    @patch("urllib.request.urlopen")
     def test_uses_cache_when_fresh(self, mock_urlopen):
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = FeedCache(Path(tmpdir))
-            cache.store("test", "<feed>cached</feed>")
+            cache.store("test", b"<feed>cached</feed>")
 
             # Should not call urlopen because cache is fresh
             content = fetch_feed(
@@ -54,16 +57,34 @@ class TestFetchFeed(unittest.TestCase):
                 max_age_seconds=60
             )
 
-            self.assertEqual(content, "<feed>cached</feed>")
+            self.assertEqual(content, b"<feed>cached</feed>")
             mock_urlopen.assert_not_called()
 
-    @patch("check_status.urllib.request.urlopen")
+    @patch("urllib.request.urlopen")
+    def test_reads_cache_once_when_stale(self, mock_urlopen):
+        mock_urlopen.return_value = MockResponse(b"<feed>fresh</feed>")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FeedCache(Path(tmpdir))
+            cache.store("test", b"<feed>stale</feed>", etag='"abc123"')
+
+            with patch.object(cache, "get", wraps=cache.get) as mock_get:
+                fetch_feed(
+                    "https://example.com/feed.atom",
+                    cache=cache,
+                    cache_key="test",
+                    max_age_seconds=0
+                )
+
+            mock_get.assert_called_once_with("test")
+
+    @patch("urllib.request.urlopen")
     def test_fetches_when_cache_stale(self, mock_urlopen):
         mock_urlopen.return_value = MockResponse(b"<feed>fresh</feed>")
 
         with tempfile.TemporaryDirectory() as tmpdir:
             cache = FeedCache(Path(tmpdir))
-            cache.store("test", "<feed>stale</feed>")
+            cache.store("test", b"<feed>stale</feed>")
 
             # max_age_seconds=0 means cache is always stale
             content = fetch_feed(
@@ -73,10 +94,10 @@ class TestFetchFeed(unittest.TestCase):
                 max_age_seconds=0
             )
 
-            self.assertEqual(content, "<feed>fresh</feed>")
+            self.assertEqual(content, b"<feed>fresh</feed>")
             mock_urlopen.assert_called_once()
 
-    @patch("check_status.urllib.request.urlopen")
+    @patch("urllib.request.urlopen")
     def test_stores_etag_in_cache(self, mock_urlopen):
         response = MockResponse(b"<feed>test</feed>", headers={"ETag": '"abc123"'})
         mock_urlopen.return_value = response
@@ -94,6 +115,270 @@ class TestFetchFeed(unittest.TestCase):
             cached = cache.get("test")
             self.assertEqual(cached["etag"], '"abc123"')
 
+    @patch("urllib.request.urlopen")
+    def test_stores_last_modified_in_cache(self, mock_urlopen):
+        last_modified = "Wed, 04 Feb 2026 17:21:16 GMT"
+        mock_urlopen.return_value = MockResponse(
+            b"<feed>test</feed>", headers={"Last-Modified": last_modified}
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FeedCache(Path(tmpdir))
+
+            fetch_feed(
+                "https://example.com/feed.atom",
+                cache=cache,
+                cache_key="test",
+                max_age_seconds=0
+            )
+
+            self.assertEqual(cache.get("test")["last_modified"], last_modified)
+
+    @patch("urllib.request.urlopen")
+    def test_sends_conditional_headers_and_uses_cache_on_304(self, mock_urlopen):
+        last_modified = "Wed, 04 Feb 2026 17:21:16 GMT"
+        mock_urlopen.side_effect = urllib.error.HTTPError(
+            "https://example.com/feed.atom", 304, "Not Modified", {}, None
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FeedCache(Path(tmpdir))
+            cache.store(
+                "test", b"<feed>cached</feed>", etag='"abc123"', last_modified=last_modified
+            )
+
+            content = fetch_feed(
+                "https://example.com/feed.atom",
+                cache=cache,
+                cache_key="test",
+                max_age_seconds=0
+            )
+
+            self.assertEqual(content, b"<feed>cached</feed>")
+            req = mock_urlopen.call_args.args[0]
+            self.assertEqual(req.get_header("If-none-match"), '"abc123"')
+            self.assertEqual(req.get_header("If-modified-since"), last_modified)
+            self.assertEqual(cache.get("test")["last_modified"], last_modified)
+
+    @patch("urllib.request.urlopen")
+    def test_sends_only_validators_it_has(self, mock_urlopen):
+        mock_urlopen.side_effect = urllib.error.HTTPError(
+            "https://example.com/feed.atom", 304, "Not Modified", {}, None
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FeedCache(Path(tmpdir))
+            cache.store("test", b"<feed>cached</feed>", etag='"abc123"')
+
+            fetch_feed(
+                "https://example.com/feed.atom",
+                cache=cache,
+                cache_key="test",
+                max_age_seconds=0
+            )
+
+            req = mock_urlopen.call_args.args[0]
+            self.assertEqual(req.get_header("If-none-match"), '"abc123"')
+            self.assertIsNone(req.get_header("If-modified-since"))
+
+    @patch("urllib.request.urlopen")
+    def test_updates_validators_from_304_response(self, mock_urlopen):
+        mock_urlopen.side_effect = urllib.error.HTTPError(
+            "https://example.com/feed.atom", 304, "Not Modified", {"ETag": '"def456"'}, None
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FeedCache(Path(tmpdir))
+            cache.store("test", b"<feed>cached</feed>", etag='"abc123"')
+
+            content = fetch_feed(
+                "https://example.com/feed.atom",
+                cache=cache,
+                cache_key="test",
+                max_age_seconds=0
+            )
+
+            self.assertEqual(content, b"<feed>cached</feed>")
+            self.assertEqual(cache.get("test")["etag"], '"def456"')
+
+    @patch("urllib.request.urlopen")
+    def test_stale_while_revalidate_returns_cached_and_refreshes(self, mock_urlopen):
+        mock_urlopen.return_value = MockResponse(b"<feed>fresh</feed>")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FeedCache(Path(tmpdir))
+            cache.store("test", b"<feed>stale</feed>")
+
+            with self._joining_revalidation_threads() as threads:
+                content = fetch_feed(
+                    "https://example.com/feed.atom",
+                    cache=cache,
+                    cache_key="test",
+                    max_age_seconds=0,
+                    stale_while_revalidate=True,
+                )
+
+            self.assertEqual(len(threads), 1)
+            self.assertEqual(content, b"<feed>stale</feed>")
+            self.assertEqual(cache.get("test")["content"], b"<feed>fresh</feed>")
+            mock_urlopen.assert_called_once()
+
+    @patch("urllib.request.urlopen")
+    def test_stale_while_revalidate_keeps_cache_on_error(self, mock_urlopen):
+        mock_urlopen.side_effect = urllib.error.URLError("offline")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FeedCache(Path(tmpdir))
+            cache.store("test", b"<feed>stale</feed>")
+
+            with self._joining_revalidation_threads() as threads:
+                content = fetch_feed(
+                    "https://example.com/feed.atom",
+                    cache=cache,
+                    cache_key="test",
+                    max_age_seconds=0,
+                    stale_while_revalidate=True,
+                )
+
+            self.assertEqual(len(threads), 1)
+            self.assertEqual(content, b"<feed>stale</feed>")
+            self.assertEqual(cache.get("test")["content"], b"<feed>stale</feed>")
+
+    @patch("urllib.request.urlopen")
+    def test_stale_while_revalidate_keeps_cache_on_http_exception(self, mock_urlopen):
+        mock_urlopen.side_effect = http.client.IncompleteRead(b"<feed>")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FeedCache(Path(tmpdir))
+            cache.store("test", b"<feed>stale</feed>")
+
+            with patch("threading.excepthook") as excepthook:
+                with self._joining_revalidation_threads() as threads:
+                    content = fetch_feed(
+                        "https://example.com/feed.atom",
+                        cache=cache,
+                        cache_key="test",
+                        max_age_seconds=0,
+                        stale_while_revalidate=True,
+                    )
+
+            self.assertEqual(len(threads), 1)
+            excepthook.assert_not_called()
+            self.assertEqual(content, b"<feed>stale</feed>")
+            self.assertEqual(cache.get("test")["content"], b"<feed>stale</feed>")
+
+    @patch("urllib.request.urlopen")
+    def test_stale_while_revalidate_fetches_when_not_cached(self, mock_urlopen):
+        mock_urlopen.return_value = MockResponse(b"<feed>fresh</feed>")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FeedCache(Path(tmpdir))
+
+            content = fetch_feed(
+                "https://example.com/feed.atom",
+                cache=cache,
+                cache_key="test",
+                stale_while_revalidate=True,
+            )
+
+            self.assertEqual(content, b"<feed>fresh</feed>")
+
+    @contextmanager
+    def _joining_revalidation_threads(self):
+        """Record the threads started inside the block and join them on exit."""
+        threads = []
+        thread_class = threading.Thread
+
+        def make_thread(*args, **kwargs):
+            thread = thread_class(*args, **kwargs)
+            threads.append(thread)
+            return thread
+
+        with patch("threading.Thread", side_effect=make_thread):
+            yield threads
+        for thread in threads:
+            thread.join()
+
+
+class TestFeedSizeLimit(unittest.TestCase):
+    @patch("urllib.request.urlopen")
+    def test_rejects_large_content_length(self, mock_urlopen):
+        mock_urlopen.return_value = MockResponse(
+            b"<feed>test</feed>", headers={"Content-Length": "2048"}
+        )
+
+        with self.assertRaises(FeedTooLargeError):
+            fetch_feed("https://example.com/feed.atom", max_size_bytes=1024)
+
+    @patch("urllib.request.urlopen")
+    def test_reads_body_with_content_length(self, mock_urlopen):
+        mock_urlopen.return_value = MockResponse(
+            b"<feed>test</feed>", headers={"Content-Length": "17"}
+        )
+
+        content = fetch_feed("https://example.com/feed.atom")
+
+        self.assertEqual(content, b"<feed>test</feed>")
+
+    @patch("urllib.request.urlopen")
+    def test_rejects_large_body_without_content_length(self, mock_urlopen):
+        mock_urlopen.return_value = MockResponse(b"x" * 200_000)
+
+        with self.assertRaises(FeedTooLargeError):
+            fetch_feed("https://example.com/feed.atom", max_size_bytes=100_000)
+
+    @patch("urllib.request.urlopen")
+    def test_reads_multi_chunk_body_without_content_length(self, mock_urlopen):
+        body = b"x" * 200_000
+        mock_urlopen.return_value = MockResponse(body)
+
+        content = fetch_feed("https://example.com/feed.atom")
+
+        self.assertEqual(len(content), len(body))
+
+
+class TestFetchFeeds(unittest.TestCase):
+    @patch("urllib.request.urlopen")
+    def test_fetches_each_feed_by_key(self, mock_urlopen):
+        def respond(req, timeout):
+            return MockResponse(f"<feed>{req.full_url}</feed>".encode())
+
+        mock_urlopen.side_effect = respond
+
+        results = fetch_feeds({
+            "claude": "https://example.com/claude.atom",
+            "github": "https://example.com/github.atom",
+        })
+
+        self.assertEqual(results, {
+            "claude": b"<feed>https://example.com/claude.atom</feed>",
+            "github": b"<feed>https://example.com/github.atom</feed>",
+        })
+        self.assertEqual(mock_urlopen.call_count, 2)
+
+    @patch("urllib.request.urlopen")
+    def test_uses_cache_per_key(self, mock_urlopen):
+        mock_urlopen.return_value = MockResponse(b"<feed>fresh</feed>")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FeedCache(Path(tmpdir))
+            cache.store("claude", b"<feed>cached</feed>")
+
+            results = fetch_feeds(
+                {
+                    "claude": "https://example.com/claude.atom",
+                    "github": "https://example.com/github.atom",
+                },
+                cache=cache,
+            )
+
+            self.assertEqual(results["claude"], b"<feed>cached</feed>")
+            self.assertEqual(results["github"], b"<feed>fresh</feed>")
+            mock_urlopen.assert_called_once()
+
+    def test_returns_empty_dict_for_no_feeds(self):
+        self.assertEqual(fetch_feeds({}), {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 """Tests for incident formatting."""
 
+import dataclasses
+import pickle
 import sys
 import unittest
 from datetime import datetime, timezone, timedelta
@@ -8,7 +10,13 @@ from pathlib import Path
 # Add the scripts directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "status-page" / "scripts"))
 
-from check_status import Incident, is_likely_resolved, is_likely_active, format_incidents
+from check_status import (
+    Incident,
+    format_incidents,
+    is_likely_active,
+    is_likely_resolved,
+    parse_timestamp,
+)
 
 
 class TestIsLikelyResolved(unittest.TestCase):
@@ -43,6 +51,59 @@ class TestIsLikelyResolved(unittest.TestCase):
         self.assertTrue(is_likely_resolved(Incident(title="", link="", status="Fully operational")))
 
 
+class TestPublishedDatetime(unittest.TestCase):
+    def test_parses_iso_timestamp(self):
+        incident = Incident(title="", link="", status="", published="2026-02-04T17:06:50Z")
+        self.assertEqual(
+            incident.published_dt, datetime(2026, 2, 4, 17, 6, 50, tzinfo=timezone.utc)
+        )
+
+    def test_parses_rfc822_timestamp(self):
+        incident = Incident(
+            title="", link="", status="", published="Wed, 04 Feb 2026 17:06:50 +0000"
+        )
+        self.assertEqual(
+            incident.published_dt, datetime(2026, 2, 4, 17, 6, 50, tzinfo=timezone.utc)
+        )
+
+    def test_parses_rfc822_timestamp_without_weekday(self):
+        incident = Incident(
+            title="", link="", status="", published="04 Feb 2026 17:06:50 +0000"
+        )
+        self.assertEqual(
+            incident.published_dt, datetime(2026, 2, 4, 17, 6, 50, tzinfo=timezone.utc)
+        )
+
+    def test_unparseable_timestamp_is_none(self):
+        self.assertIsNone(Incident(title="", link="", status="", published="soon").published_dt)
+
+    def test_missing_timestamp_is_none(self):
+        self.assertIsNone(Incident(title="", link="", status="").published_dt)
+
+
+class TestParseTimestamp(unittest.TestCase):
+    def test_reuses_result_for_repeated_timestamp(self):
+        first = parse_timestamp("2026-02-04T17:06:50Z")
+        self.assertIs(parse_timestamp("2026-02-04T17:06:50Z"), first)
+
+
+class TestIncident(unittest.TestCase):
+    def test_has_no_instance_dict(self):
+        self.assertFalse(hasattr(Incident(title="", link="", status=""), "__dict__"))
+
+    def test_is_immutable_and_hashable(self):
+        incident = Incident(title="Test", link="", status="Resolved")
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            incident.status = "Investigating"
+        self.assertEqual(len({incident, Incident(title="Test", link="", status="Resolved")}), 1)
+
+    def test_round_trips_through_pickle(self):
+        incident = Incident(title="Test", link="", status="Resolved", published="2026-02-04T17:06:50Z")
+        restored = pickle.loads(pickle.dumps(incident))
+        self.assertEqual(restored, incident)
+        self.assertEqual(restored.published_dt, incident.published_dt)
+
+
 class TestIsLikelyActive(unittest.TestCase):
     """Test active incident detection (recent AND not resolved)."""
 
@@ -81,6 +142,17 @@ class TestIsLikelyActive(unittest.TestCase):
         )
         self.assertFalse(is_likely_active(incident))
 
+    def test_uses_given_now(self):
+        incident = Incident(
+            title="Test",
+            link="",
+            status="Investigating",
+            published="2026-02-04T16:39:00Z"
+        )
+        now = datetime(2026, 2, 4, 16, 47, tzinfo=timezone.utc)
+        self.assertTrue(is_likely_active(incident, now=now))
+        self.assertFalse(is_likely_active(incident, now=now + timedelta(hours=5)))
+
     def test_no_timestamp_is_not_active(self):
         incident = Incident(title="Test", link="", status="Investigating")
         self.assertFalse(is_likely_active(incident))
@@ -112,6 +184,21 @@ class TestFormatIncidents(unittest.TestCase):
         self.assertIn("ACTIVE INCIDENTS", output)
         self.assertIn("Ongoing Issue", output)
 
+    def test_lists_links_under_their_incident(self):
+        incidents = [
+            Incident(
+                title="Ongoing Issue",
+                link="http://example.com/1",
+                status="Investigating",
+                published=self._recent_timestamp()
+            ),
+            Incident(title="Old Issue", link="", status="Resolved"),
+        ]
+        output = format_incidents("Test Service", incidents)
+        self.assertIn(">>> [Investigating] Ongoing Issue\n    http://example.com/1\n", output)
+        self.assertIn("- [Investigating] Ongoing Issue\n  http://example.com/1\n", output)
+        self.assertTrue(output.endswith("- [Resolved] Old Issue"))
+
     def test_shows_no_active_when_old_incident(self):
         """Old unresolved incidents should not show as active."""
         old_timestamp = (datetime.now(timezone.utc) - timedelta(hours=48)).isoformat()
@@ -12,9 +12,7 @@ from pathlib import Path
 # Add the scripts directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "status-page" / "scripts"))
 
-from check_status import parse_atom_feed
-
-FIXTURES_DIR = Path(__file__).parent / "fixtures" / "claude"
+from _fixtures import claude_atom
 
 # The time the user saw API errors: 2026-02-04 08:47 US-Pacific
 # Pacific Standard Time is UTC-8
@@ -28,8 +26,7 @@ class TestIncidentCorrelation(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        content = (FIXTURES_DIR / "2026-02-04-history.atom").read_text()
-        cls.incidents = parse_atom_feed(content)
+        cls.incidents = claude_atom()
 
     def test_fixture_has_incident_from_error_time(self):
         """The fixture should contain an incident from around the error time."""
@@ -54,7 +51,7 @@ class TestIncidentCorrelation(unittest.TestCase):
         since the feed shows the most recent update. This test documents the limitation.
         """
         # Find the relevant incident
-        incident = next(i for i in self.incidents if i.title == "Elevated errors on Claude models")
+        incident = self.incidents.by_title["Elevated errors on Claude models"]
 
         # The feed shows final status as Resolved
         # In a live scenario during the outage, this would have shown Investigating/Identified
@@ -1,8 +1,10 @@
 """Tests for main() function."""
 
+import subprocess
 import sys
 import tempfile
 import unittest
+from contextlib import redirect_stdout
 from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
@@ -12,83 +14,138 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "status-page" /
 
 import check_status
 
-FIXTURES_DIR = Path(__file__).parent / "fixtures" / "claude"
+from _fixtures import CLAUDE_ATOM_BYTES
 
 
 class TestMain(unittest.TestCase):
-    def setUp(self):
-        self.held_stdout = StringIO()
-        self.held_stderr = StringIO()
-        self.temp_dir = tempfile.TemporaryDirectory()
+    @classmethod
+    def setUpClass(cls):
+        # One cache dir for the class, so later tests run against a warm cache
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.tmp_path = Path(cls.temp_dir.name)
 
-    def tearDown(self):
-        self.temp_dir.cleanup()
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
 
     @patch("check_status.fetch_feed")
     @patch("check_status.get_default_cache_dir")
     def test_main_outputs_status(self, mock_cache_dir, mock_fetch):
         # Setup mocks
-        mock_cache_dir.return_value = Path(self.temp_dir.name)
-        mock_fetch.return_value = (FIXTURES_DIR / "2026-02-04-history.atom").read_text()
+        mock_cache_dir.return_value = self.tmp_path
+        mock_fetch.return_value = CLAUDE_ATOM_BYTES
 
         # Run main with captured stdout
+        buf = StringIO()
         with patch.object(sys, "argv", ["check_status.py", "claude"]):
-            with patch.object(sys, "stdout", self.held_stdout):
+            with redirect_stdout(buf):
                 check_status.main()
 
-        output = self.held_stdout.getvalue()
+        output = buf.getvalue()
         self.assertIn("Claude Status", output)
         self.assertIn("Elevated errors on Claude models", output)
+        self.assertTrue(output.endswith("\n"))
 
     @patch("check_status.fetch_feed")
     @patch("check_status.get_default_cache_dir")
     def test_main_shows_no_active_when_resolved(self, mock_cache_dir, mock_fetch):
-        mock_cache_dir.return_value = Path(self.temp_dir.name)
-        mock_fetch.return_value = (FIXTURES_DIR / "2026-02-04-history.atom").read_text()
+        mock_cache_dir.return_value = self.tmp_path
+        mock_fetch.return_value = CLAUDE_ATOM_BYTES
 
+        buf = StringIO()
         with patch.object(sys, "argv", ["check_status.py", "claude"]):
-            with patch.object(sys, "stdout", self.held_stdout):
+            with redirect_stdout(buf):
                 check_status.main()
 
-        output = self.held_stdout.getvalue()
+        output = buf.getvalue()
         self.assertIn("No active incidents", output)
 
+    @patch("check_status.fetch_feed")
+    @patch("check_status.get_default_cache_dir")
+    def test_main_reuses_parsed_incidents_for_unchanged_feed(self, mock_cache_dir, mock_fetch):
+        mock_fetch.return_value = CLAUDE_ATOM_BYTES
+
+        # Needs a cold cache, unlike the shared class-level one
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_cache_dir.return_value = Path(tmpdir)
+            with patch("check_status.parse_atom_feed", wraps=check_status.parse_atom_feed) as mock_parse:
+                with patch.object(sys, "argv", ["check_status.py", "claude"]):
+                    with redirect_stdout(StringIO()):
+                        check_status.main()
+
+                mock_parse.assert_called_once()
+                self.assertTrue(list((Path(tmpdir) / "content").glob("*.atom.json")))
+                mock_parse.reset_mock()
+
+                buf = StringIO()
+                with patch.object(sys, "argv", ["check_status.py", "claude"]):
+                    with redirect_stdout(buf):
+                        check_status.main()
+
+        mock_parse.assert_not_called()
+        self.assertIn("Elevated errors on Claude models", buf.getvalue())
+
     def test_main_exits_on_unknown_service(self):
+        buf = StringIO()
         with patch.object(sys, "argv", ["check_status.py", "unknown-service"]):
-            with patch.object(sys, "stdout", self.held_stdout):
+            with redirect_stdout(buf):
                 with self.assertRaises(SystemExit) as ctx:
                     check_status.main()
                 self.assertEqual(ctx.exception.code, 1)
 
-        output = self.held_stdout.getvalue()
+        output = buf.getvalue()
         self.assertIn("Unknown service", output)
+        self.assertIn("\nAvailable services: claude, github\n", output)
+
+    def test_main_unknown_service_skips_network_and_xml_imports(self):
+        code = (
+            "import sys\n"
+            "import check_status\n"
+            "sys.argv = ['check_status.py', 'unknown-service']\n"
+            "try:\n"
+            "    check_status.main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in ('urllib.request', 'xml.etree.ElementTree')"
+            " if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(check_status.__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.splitlines()[-1], "[]")
 
     @patch("check_status.fetch_feed")
     @patch("check_status.get_default_cache_dir")
     def test_main_defaults_to_claude(self, mock_cache_dir, mock_fetch):
         """When no service argument is provided, default to Claude."""
-        mock_cache_dir.return_value = Path(self.temp_dir.name)
-        mock_fetch.return_value = (FIXTURES_DIR / "2026-02-04-history.atom").read_text()
+        mock_cache_dir.return_value = self.tmp_path
+        mock_fetch.return_value = CLAUDE_ATOM_BYTES
 
+        buf = StringIO()
         with patch.object(sys, "argv", ["check_status.py"]):
-            with patch.object(sys, "stdout", self.held_stdout):
+            with redirect_stdout(buf):
                 check_status.main()
 
-        output = self.held_stdout.getvalue()
+        output = buf.getvalue()
         self.assertIn("Claude Status", output)
 
     @patch("check_status.fetch_feed")
     @patch("check_status.get_default_cache_dir")
     def test_main_handles_alias(self, mock_cache_dir, mock_fetch):
-        mock_cache_dir.return_value = Path(self.temp_dir.name)
-        mock_fetch.return_value = (FIXTURES_DIR / "2026-02-04-history.atom").read_text()
+        mock_cache_dir.return_value = self.tmp_path
+        mock_fetch.return_value = CLAUDE_ATOM_BYTES
 
         # Use alias "anthropic" instead of "claude"
+        buf = StringIO()
         with patch.object(sys, "argv", ["check_status.py", "anthropic"]):
-            with patch.object(sys, "stdout", self.held_stdout):
+            with redirect_stdout(buf):
                 check_status.main()
 
-        output = self.held_stdout.getvalue()
+        output = buf.getvalue()
         self.assertIn("Claude Status", output)
 
 
@@ -7,16 +7,15 @@ from pathlib import Path
 # Add the scripts directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "status-page" / "scripts"))
 
-from check_status import parse_atom_feed, parse_rss_feed
+from check_status import Incident, IncidentFeed, parse_atom_feed, parse_feed, parse_rss_feed
 
-FIXTURES_DIR = Path(__file__).parent / "fixtures" / "claude"
+from _fixtures import CLAUDE_ATOM_BYTES, CLAUDE_RSS_BYTES, claude_atom, claude_rss
 
 
 class TestParseAtomFeed(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        content = (FIXTURES_DIR / "2026-02-04-history.atom").read_text()
-        cls.incidents = parse_atom_feed(content)
+        cls.incidents = claude_atom()
 
     def test_parses_atom_feed(self):
         self.assertGreater(len(self.incidents), 0)
@@ -33,12 +32,25 @@ class TestParseAtomFeed(unittest.TestCase):
     def test_extracts_published_date(self):
         self.assertEqual(self.incidents[0].published, "2026-02-04T17:06:50Z")
 
+    def test_indexes_incidents_by_title_and_link(self):
+        incident = self.incidents[0]
+        self.assertIs(self.incidents.by_title[incident.title], incident)
+        self.assertIs(self.incidents.by_link[incident.link], incident)
+
+    def test_ignores_nested_entries(self):
+        xml = (
+            b'<feed xmlns="http://www.w3.org/2005/Atom">'
+            b"<entry><title>top</title></entry>"
+            b"<x><entry><title>nested</title></entry></x>"
+            b"</feed>"
+        )
+        self.assertEqual([i.title for i in parse_atom_feed(xml)], ["top"])
+
 
 class TestParseRssFeed(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        content = (FIXTURES_DIR / "2026-02-04-history.rss").read_text()
-        cls.incidents = parse_rss_feed(content)
+        cls.incidents = claude_rss()
 
     def test_parses_rss_feed(self):
         self.assertGreater(len(self.incidents), 0)
@@ -56,5 +68,48 @@ class TestParseRssFeed(unittest.TestCase):
         self.assertIn("Wed, 04 Feb 2026", self.incidents[0].published)
 
 
+class TestParseFeed(unittest.TestCase):
+    def test_detects_atom_feed(self):
+        self.assertEqual(parse_feed(CLAUDE_ATOM_BYTES), claude_atom())
+
+    def test_detects_rss_feed(self):
+        self.assertEqual(parse_feed(CLAUDE_RSS_BYTES), claude_rss())
+
+
+class TestIncidentFeed(unittest.TestCase):
+    def test_first_incident_wins_for_duplicate_titles(self):
+        newer = Incident(title="Outage", link="https://example.com/2", status="Resolved")
+        older = Incident(title="Outage", link="https://example.com/1", status="Resolved")
+        feed = IncidentFeed([newer, older])
+        self.assertIs(feed.by_title["Outage"], newer)
+        self.assertIs(feed.by_link["https://example.com/1"], older)
+
+    def test_compares_equal_to_list(self):
+        self.assertEqual(IncidentFeed(), [])
+
+
+class TestFeedEncoding(unittest.TestCase):
+    def test_parses_bytes_in_declared_encoding(self):
+        xml = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            "<rss><channel><item><title>Dégradé</title></item></channel></rss>"
+        ).encode("iso-8859-1")
+        incidents = parse_rss_feed(xml)
+        self.assertEqual(incidents[0].title, "Dégradé")
+
+    def test_accepts_str_content(self):
+        xml = "<rss><channel><item><title>Incident</title></item></channel></rss>"
+        self.assertEqual(parse_rss_feed(xml)[0].title, "Incident")
+
+    def test_str_content_ignores_declared_encoding(self):
+        for encoding in ("ISO-8859-1", "UTF-16"):
+            with self.subTest(encoding=encoding):
+                xml = (
+                    f'<?xml version="1.0" encoding="{encoding}"?>'
+                    "<rss><channel><item><title>Dégradé</title></item></channel></rss>"
+                )
+                self.assertEqual(parse_rss_feed(xml)[0].title, "Dégradé")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,16 +7,13 @@ from pathlib import Path
 # Add the scripts directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "status-page" / "scripts"))
 
-from check_status import parse_atom_feed, parse_rss_feed
-
-FIXTURES_DIR = Path(__file__).parent / "fixtures" / "github"
+from _fixtures import github_atom, github_rss
 
 
 class TestParseGitHubAtomFeed(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        content = (FIXTURES_DIR / "2026-02-04-history.atom").read_text()
-        cls.incidents = parse_atom_feed(content)
+        cls.incidents = github_atom()
 
     def test_parses_atom_feed(self):
         self.assertGreater(len(self.incidents), 0)
@@ -42,8 +39,7 @@ class TestParseGitHubAtomFeed(unittest.TestCase):
 class TestParseGitHubRssFeed(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        content = (FIXTURES_DIR / "2026-02-04-history.rss").read_text()
-        cls.incidents = parse_rss_feed(content)
+        cls.incidents = github_rss()
 
     def test_parses_rss_feed(self):
         self.assertGreater(len(self.incidents), 0)